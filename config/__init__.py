@@ -1,5 +1,5 @@
 """Configuration package for the summarizing agent."""
 
-from .settings import settings, Settings
+from .settings import settings, get_settings, Settings
 
-__all__ = ["settings", "Settings"]
+__all__ = ["settings", "get_settings", "Settings"]
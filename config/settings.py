@@ -1,111 +1,214 @@
 """
 Configuration settings for the Scientific Paper Summarizing Agent.
 
-This module uses Pydantic for settings management, allowing configuration
-through environment variables or direct modification.
+Settings are plain dataclass fields whose defaults are resolved from
+environment variables. For a config this small the pydantic BaseSettings
+machinery (model-schema build, validator registration) dominated import
+time, so the fields read the environment directly instead.
 """
 
+import os
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from typing import FrozenSet
 
+#: Sentinel distinguishing "not probed yet" from "probed, unavailable".
+_ST_UNSET = object()
+_st = _ST_UNSET
 
-class Settings(BaseSettings):
+
+def _streamlit_module():
+    """Return the streamlit module, or None outside web deployments.
+
+    Imported lazily on first use and memoized: streamlit is a heavy
+    import, and pulling it in at module scope would make every CLI run
+    (main.py --help included) pay for it just to read settings. In web
+    deployments streamlit is already in sys.modules, so the first call
+    costs a dict lookup.
+    """
+    global _st
+    if _st is _ST_UNSET:
+        try:
+            import streamlit
+            _st = streamlit
+        except ImportError:
+            _st = None
+    return _st
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_path(name: str, default: str) -> Path:
+    return Path(os.getenv(name, default))
+
+
+def _env_sections(name: str, default: FrozenSet[str]) -> FrozenSet[str]:
+    """Parse a comma-separated section list from the environment."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return frozenset(s.strip().lower() for s in raw.split(',') if s.strip())
+
+
+@dataclass
+class Settings:
     """
     Application settings with support for environment variables.
-    
+
     Attributes:
         google_api_key: API key for Google's Generative AI
         model_name: The Gemini model to use
         temperature: Creativity level (0.0-1.0)
         max_tokens: Maximum tokens in response
-        chunk_size: Size of text chunks for processing
-        chunk_overlap: Overlap between chunks
-        output_dir: Directory for saving summaries
-        data_dir: Directory for input papers
+        chunk_size: Approximate characters per chunk for streamed extraction
+        priority_sections: Sections to prioritize in summarization
+        summary_max_words: Target word count for summary
+        include_key_findings: Whether to extract key findings separately
+        include_methodology: Whether to include methodology summary
+        use_cache: Whether to serve repeated LLM prompts from the disk cache
+        output_dir: Directory for saving summaries (created on first access)
+        data_dir: Directory for input papers (created on first access)
     """
-    # API Configuration
-    google_api_key: str = Field(
-        default="",
-        description="Google API Key for Generative AI"
-    )
-    
     # Model Configuration
-    model_name: str = Field(
+    model_name: str = field(
         # Can be overridden via the MODEL_NAME environment variable.
-        default="gemini-2.5-flash",
-        description="Gemini model to use"
+        default_factory=lambda: _env_str('MODEL_NAME', 'gemini-2.5-flash')
     )
-    temperature: float = Field(
-        default=0.3,
-        ge=0.0,
-        le=1.0,
-        description="Model temperature for response generation"
+    temperature: float = field(
+        default_factory=lambda: min(1.0, max(0.0, _env_float('TEMPERATURE', 0.3)))
     )
-    max_tokens: int = Field(
-        default=16384,
-        description="Maximum tokens in model response"
+    max_tokens: int = field(
+        default_factory=lambda: _env_int('MAX_TOKENS', 16384)
+    )
+
+    # Processing Configuration
+    chunk_size: int = field(
+        default_factory=lambda: _env_int('CHUNK_SIZE', 50000)
     )
-    
-    
+
     # Section Priorities (for scientific papers)
-    priority_sections: List[str] = Field(
-        default=[
-            "methods",
-            "methodology",
-            "results"
-        ],
-        description="Sections to prioritize in summarization"
+    priority_sections: FrozenSet[str] = field(
+        default_factory=lambda: _env_sections(
+            'PRIORITY_SECTIONS',
+            frozenset({'methods', 'methodology', 'results'})
+        )
     )
-    
+
     # Output Configuration
-    summary_max_words: int = Field(
-        default=800,
-        description="Target word count for summary"
-    )
-    include_key_findings: bool = Field(
-        default=True,
-        description="Whether to extract key findings separately"
+    summary_max_words: int = field(
+        default_factory=lambda: _env_int('SUMMARY_MAX_WORDS', 800)
     )
-    include_methodology: bool = Field(
-        default=True,
-        description="Whether to include methodology summary"
+    include_key_findings: bool = field(
+        default_factory=lambda: _env_bool('INCLUDE_KEY_FINDINGS', True)
     )
-    
-    # Directory Configuration
-    output_dir: Path = Field(
-        default=Path("outputs"),
-        description="Directory for output summaries"
+    include_methodology: bool = field(
+        default_factory=lambda: _env_bool('INCLUDE_METHODOLOGY', True)
     )
-    data_dir: Path = Field(
-        default=Path("data"),
-        description="Directory for input papers"
+    use_cache: bool = field(
+        default_factory=lambda: _env_bool('USE_CACHE', True)
     )
-    
-    class Config:
-        case_sensitive = False
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Create directories if they don't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    # API Configuration and directories are lazy: the env lookup and mkdir
+    # side effects only happen when a consumer actually reads the attribute,
+    # and are cached on the instance afterwards.
+
+    @cached_property
+    def google_api_key(self) -> str:
+        """API key for Google's Generative AI."""
+        return _env_str('GOOGLE_API_KEY', '')
+
+    @cached_property
+    def output_dir(self) -> Path:
+        """Directory for output summaries; created on first access."""
+        path = _env_path('OUTPUT_DIR', 'outputs')
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @cached_property
+    def data_dir(self) -> Path:
+        """Directory for input papers; created on first access."""
+        path = _env_path('DATA_DIR', 'data')
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def __post_init__(self):
+        # Lowercase once and freeze so membership checks are O(1), also when
+        # sections are passed directly instead of coming from the environment.
+        self.priority_sections = frozenset(
+            str(s).lower() for s in self.priority_sections
+        )
+
+    def ensure_dirs(self) -> None:
+        """Create output/data directories if they don't exist.
+
+        Accessing the lazy properties performs the mkdir; this method just
+        forces both for callers that want the directories up front.
+        """
+        self.output_dir
+        self.data_dir
+
     def validate_api_key(self) -> bool:
         """
-        Validate API key from session state or settings.
-        Prioritizes session state for security.
+        Validate API key from settings or the Streamlit session state.
+
+        The configured key is checked first so CLI runs short-circuit without
+        touching Streamlit; the session-state key is consulted only as a
+        fallback in web deployments.
         """
-        try:
-            import streamlit as st
-            # Check session state first (most secure)
-            session_key = st.session_state.get('api_key', '')
-            active_key = session_key or self.google_api_key
-        except:
-            active_key = self.google_api_key
-            
-        key = (active_key or "").strip()
-        return bool(key) and key.startswith("AIza") and len(key) > 30
-
-settings = Settings()
+        key = (self.google_api_key or "").strip()
+        if key.startswith("AIza") and len(key) > 30:
+            return True
+
+        st_mod = _streamlit_module()
+        if st_mod is not None:
+            try:
+                session_key = st_mod.session_state.get('api_key', '')
+            except Exception:
+                session_key = ''
+            key = (session_key or "").strip()
+            return key.startswith("AIza") and len(key) > 30
+
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Caching means the environment is read once per process instead of on
+    every import or reload path.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -5,7 +5,7 @@ Provides a command-line interface for processing scientific papers.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import sys
 
 try:
@@ -18,10 +18,13 @@ except ImportError:
     click = None
     Console = None
 
-from src.agent import SummarizingAgent
-from src.utils.logger import logger, setup_logger
 from config.settings import settings
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime (see main/run_example) so that --help and
+    # argument-error paths don't pay for the agent's transitive imports.
+    from src.agent import SummarizingAgent
+
 
 # Rich console for beautiful output
 console = Console() if Console else None
@@ -145,6 +148,9 @@ if click:
             # Use a specific model
             python main.py --file paper.pdf --model gemini-1.5-pro-latest
         """
+        # Deferred: pulls in the document processors and the Gemini SDK
+        from src.utils.logger import logger, setup_logger
+
         # Set up logging
         if verbose:
             setup_logger(level=10)  # DEBUG
@@ -176,6 +182,8 @@ if click:
             sys.exit(1)
         
         try:
+            from src.agent import SummarizingAgent
+
             # Initialize agent
             agent = SummarizingAgent(
                 model_name=model,
@@ -222,6 +230,9 @@ def run_example():
     
     This function demonstrates basic usage without CLI arguments.
     """
+    from src.agent import SummarizingAgent
+    from src.utils.logger import logger
+
     print_welcome()
     
     # Check for sample file
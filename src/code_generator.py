@@ -6,15 +6,155 @@ Includes validation, error handling, and comprehensive prompts.
 """
 
 import ast
+import asyncio
+import json
+import re
+from functools import lru_cache
+from string import Template
 from typing import Optional, Dict, List, Tuple
 import google.generativeai as genai
 
 from .utils.text_processor import detect_sections, extract_section, truncate_to_words
 from .utils.logger import logger
+from .utils import llm_cache
 from .summarizers.scientific_summarizer import Summary
 from config.settings import settings
 
 
+# Splits the fused single-request response into its code and explanation
+# blocks (see _build_code_prompt for the requested format).
+_CODE_EXPL_RE = re.compile(
+    r"<CODE>(.*?)</CODE>\s*<EXPLANATION>(.*?)</EXPLANATION>",
+    re.DOTALL,
+)
+
+# Markers of implementable content in section headings. Compiled into one
+# alternation so each heading is scanned in a single C-level pass instead
+# of one Python-level substring search per keyword.
+_CODE_KEYWORDS = (
+    'algorithm', 'implementation', 'procedure', 'method',
+    'preprocessing', 'data processing', 'model', 'computation',
+    'experimental setup', 'analysis', 'statistical', 'approach',
+    'technique', 'framework', 'architecture',
+)
+_CODE_KW_RE = re.compile('|'.join(map(re.escape, _CODE_KEYWORDS)), re.IGNORECASE)
+
+# First fenced markdown block in a response, with or without a language
+# tag; one compiled search replaces chained str.find bookkeeping.
+_MD_BLOCK_RE = re.compile(r"```(?:python|py)?\s*\n?(.*?)```", re.DOTALL)
+
+# Parsed once at import; batch generation substitutes the per-section
+# fields instead of rebuilding the large static body every call.
+_CODE_PROMPT_TMPL = Template("""Generate a complete, runnable Python implementation of the methodology described below.
+
+# PAPER: $paper_title
+
+# SECTION TO IMPLEMENT: $section_name
+
+# METHODOLOGY:
+$methodology
+
+# DETAILED CONTENT:
+$detailed_content
+
+# REQUIREMENTS:
+Generate complete, working Python code with:
+- Proper imports (numpy, scipy, pandas as needed)
+- Type hints on functions
+- Brief docstrings
+- A working example in if __name__ == "__main__": block
+- NO placeholders or TODO comments
+
+Reply in exactly this format, with both blocks present:
+<CODE>
+```python
+# implementation here
+```
+</CODE>
+<EXPLANATION>
+3-4 sentences explaining what the code implements, the key steps, and what inputs it expects and outputs it produces.
+</EXPLANATION>
+
+Begin:
+""")
+
+# Batch prompt: every code-worthy section goes out in one request and
+# comes back as a JSON array, amortizing the instruction text and one
+# network round-trip across all sections.
+_BATCH_PROMPT_TMPL = Template("""Generate complete, runnable Python implementations for each section of this paper listed below.
+
+# PAPER: $paper_title
+
+$section_blocks
+
+# REQUIREMENTS:
+For every section above, generate complete, working Python code with:
+- Proper imports (numpy, scipy, pandas as needed)
+- Type hints on functions
+- Brief docstrings
+- A working example in if __name__ == "__main__": block
+- NO placeholders or TODO comments
+
+Reply with ONLY a JSON array, one object per section, in this exact shape:
+[{"section": "<section name exactly as given>", "code": "<python source>", "explanation": "<3-4 sentence explanation>"}]
+
+Begin:
+""")
+
+# Above this prompt size the fused request risks blowing the context
+# window; fall back to per-section generation instead.
+_MAX_BATCH_PROMPT_CHARS = 120_000
+
+# Canonical names for UI-facing section labels; module-level so the table
+# isn't rebuilt on every extraction.
+_SECTION_ALIASES = {
+    'methodology': 'methods',
+    'conclusions': 'conclusion',
+    'techniques': 'methods',
+    'approach': 'methods',
+}
+
+
+@lru_cache(maxsize=4)
+def _shared_model(model_name: str, temperature: float, max_tokens: int, key_digest: str):
+    """
+    One GenerativeModel per configuration, shared across instances.
+
+    The Streamlit UI rebuilds CodeGenerator on reruns; reusing the model
+    object keeps the SDK's underlying HTTPS channel and connection pool
+    warm instead of paying TCP/TLS setup again per rerun. key_digest
+    folds the configured credential into the cache key: the model object
+    binds its client to the API key active at first use, so a rotated
+    key must map to a fresh model instead of one still authenticated
+    with the old credential.
+    """
+    model_cls = getattr(genai, "GenerativeModel", None)
+    if not callable(model_cls):
+        return None
+    try:
+        return model_cls(
+            model_name=model_name,
+            generation_config={
+                "temperature": temperature,
+                "max_output_tokens": max_tokens,
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Model instantiation failed: {e}")
+        return None
+
+
+@lru_cache(maxsize=32)
+def _truncated(text: str, max_words: int) -> str:
+    """
+    Memoized truncate_to_words for the prompt builder.
+
+    Sections that fall back to the shared methodology summary would
+    otherwise re-split the same text once per generated section.
+    """
+    return truncate_to_words(text, max_words)
+
+
 class CodeGenerator:
     def __init__(self, model_name: Optional[str] = None):
         """
@@ -38,25 +178,25 @@ class CodeGenerator:
             except Exception:
                 logger.warning("GenAI configure failed; relying on environment auth.")
         
-        # Instantiate model
-        model_cls = getattr(genai, "GenerativeModel", None)
-        if callable(model_cls):
-            try:
-                self._model = model_cls(
-                    model_name=self.model_name,
-                    generation_config={
-                        "temperature": self.temperature,
-                        "max_output_tokens": self.max_tokens,
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Model instantiation failed: {e}")
-                self._model = None
-        else:
-            self._model = None
+        # Instantiate model (shared per configuration across instances)
+        self._model = _shared_model(
+            self.model_name, self.temperature, self.max_tokens,
+            llm_cache.prompt_key(settings.google_api_key or ''),
+        )
+
+        # Bind the generation entry points once; the hot paths then call
+        # them directly instead of re-probing the SDK with getattr per call.
+        self._gen_fn = getattr(self._model, "generate_content", None) if self._model else None
+        self._gen_async_fn = getattr(self._model, "generate_content_async", None) if self._model else None
         
         logger.info(f"Initialized CodeGenerator with model: {self.model_name}")
-    
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Disk-cache key covering model and sampling settings, not just the prompt."""
+        if not settings.use_cache:
+            return None
+        return llm_cache.prompt_key(f"{self.model_name}|{self.temperature}|{prompt}")
+
     def get_code_worthy_sections(self, summary: Summary, raw_text: str) -> List[str]:
         """
         Auto-detect sections suitable for code generation.
@@ -77,16 +217,10 @@ class CodeGenerator:
         # Detect code-worthy sections from raw text
         sections = detect_sections(raw_text)
         
-        code_keywords = [
-            'algorithm', 'implementation', 'procedure', 'method',
-            'preprocessing', 'data processing', 'model', 'computation',
-            'experimental setup', 'analysis', 'statistical', 'approach',
-            'technique', 'framework', 'architecture'
-        ]
-        
+        # Case folding happens inside the compiled pattern, so no per-name
+        # lowercase copy is allocated while scanning.
         for section_name in sections.keys():
-            section_lower = section_name.lower()
-            if any(keyword in section_lower for keyword in code_keywords):
+            if _CODE_KW_RE.search(section_name) is not None:
                 formatted_name = section_name.replace('_', ' ').title()
                 if formatted_name not in code_sections:
                     code_sections.append(formatted_name)
@@ -140,8 +274,8 @@ class CodeGenerator:
                 logger.warning(error_msg)
                 return None, None, error_msg
             
-            # Generate code with comprehensive prompt
-            code = self._generate_code_implementation(
+            # Generate code and explanation with one fused prompt
+            code, explanation = self._generate_code_implementation(
                 section_name=section_name,
                 section_text=section_text,
                 section_summary=section_summary,
@@ -149,22 +283,21 @@ class CodeGenerator:
                 paper_overview=summary.overview,
                 full_text=raw_text
             )
-            
+
             if not code:
                 return None, None, "Code generation failed. No output from model."
-            
+
+            if not explanation:
+                explanation = self._fallback_explanation(section_name)
+
             # Validate syntax
-            is_valid, validation_error = self._validate_python_syntax(code)
+            is_valid, validation_error, _tree = self._validate_python_syntax(code)
             if not is_valid:
                 logger.warning(f"Generated code has syntax errors: {validation_error}")
                 # Still return the code but with warning in explanation
-                explanation = self._generate_code_explanation(code, section_name)
                 explanation = f"⚠️ Note: Generated code may have syntax issues.\n\n{explanation}"
                 return code, explanation, None
-            
-            # Generate explanation
-            explanation = self._generate_code_explanation(code, section_name)
-            
+
             logger.info(f"Successfully generated {len(code)} characters of valid Python code")
             return code, explanation, None
             
@@ -178,6 +311,86 @@ class CodeGenerator:
             
             return None, None, error_msg
     
+    def generate_for_section_stream(
+        self,
+        section_name: str,
+        raw_text: str,
+        summary: Summary,
+    ):
+        """
+        Streaming variant of generate_for_section.
+
+        Yields ('delta', text_so_far) events as response chunks arrive,
+        then exactly one ('result', (code, explanation, error)) event
+        with the same triple contract as generate_for_section, so the UI
+        can paint partial output while waiting and still get the parsed,
+        validated artifact at the end. Cache hits and SDKs without stream
+        support emit a single delta carrying the whole response.
+        """
+        try:
+            section_text, section_summary = self._extract_section_content(
+                section_name, raw_text, summary
+            )
+            if not section_text:
+                error_msg = f"Section '{section_name}' not found in paper. Try another section."
+                logger.warning(error_msg)
+                yield 'result', (None, None, error_msg)
+                return
+
+            prompt = self._build_code_prompt(
+                section_name, section_text, section_summary, summary.title
+            )
+            logger.info(f"Prompt length: {len(prompt)} characters")
+
+            cache_key = self._cache_key(prompt)
+            raw = llm_cache.get(cache_key) if cache_key is not None else None
+            if raw is not None:
+                logger.info("LLM cache hit; skipping API call")
+                yield 'delta', raw
+            else:
+                if not callable(self._gen_fn):
+                    yield 'result', (None, None, "Code generation failed. No output from model.")
+                    return
+                try:
+                    response = self._gen_fn(prompt, stream=True)
+                    parts = []
+                    for chunk in response:
+                        text = getattr(chunk, "text", "") or ""
+                        if text:
+                            parts.append(text)
+                            yield 'delta', "".join(parts)
+                    raw = "".join(parts).strip()
+                except TypeError:
+                    # SDK variant without a stream kwarg: single blocking
+                    # call, one delta with the full response.
+                    response = self._gen_fn(prompt)
+                    raw = (getattr(response, "text", "") or "").strip()
+                    if raw:
+                        yield 'delta', raw
+                if raw and cache_key is not None:
+                    llm_cache.put(cache_key, raw)
+
+            code, explanation = self._split_code_and_explanation(raw)
+            if not code:
+                yield 'result', (None, None, "Code generation failed. No output from model.")
+                return
+            if not explanation:
+                explanation = self._fallback_explanation(section_name)
+
+            is_valid, validation_error, _tree = self._validate_python_syntax(code)
+            if not is_valid:
+                logger.warning(f"Generated code has syntax errors: {validation_error}")
+                explanation = f"⚠️ Note: Generated code may have syntax issues.\n\n{explanation}"
+
+            yield 'result', (code, explanation, None)
+
+        except Exception as e:
+            error_msg = f"Error generating code: {str(e)}"
+            logger.error(error_msg)
+            if "429" in str(e) or "quota" in str(e).lower():
+                error_msg = "⏱️ API Rate Limit Exceeded. Wait 60 seconds and try again."
+            yield 'result', (None, None, error_msg)
+
     def generate_all_sections(
         self,
         raw_text: str,
@@ -194,23 +407,257 @@ class CodeGenerator:
             Dictionary mapping section names to (code, explanation) tuples
         """
         logger.info("Generating code for all sections")
-        
+
         sections = self.get_code_worthy_sections(summary, raw_text)
         results = {}
-        
+
+        # Cheapest shape first: all sections in one JSON-returning request.
+        # Falls through to the concurrent/serial paths when the batch is
+        # too large, the call fails, or the response doesn't parse.
+        batched = self._generate_all_in_one_request(sections, raw_text, summary)
+        if batched is not None:
+            logger.info(f"Completed fused batch generation for {len(batched)} sections")
+            return batched
+
+        # Requests are network-bound, so launch every section concurrently
+        # when the SDK exposes the async API; total latency approaches the
+        # slowest single section instead of the sum.
+        if callable(self._gen_async_fn):
+            outcomes = asyncio.run(self._generate_all_sections_async(sections, raw_text, summary))
+            for section_name, outcome in zip(sections, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.warning(f"Failed to generate code for {section_name}: {outcome}")
+                    results[section_name] = (None, str(outcome))
+                    continue
+                code, explanation, error = outcome
+                if error:
+                    logger.warning(f"Failed to generate code for {section_name}: {error}")
+                    results[section_name] = (None, error)
+                else:
+                    results[section_name] = (code, explanation)
+            logger.info(f"Completed batch generation for {len(results)} sections")
+            return results
+
+        # Serial fallback for SDK variants without async support
         for section_name in sections:
             code, explanation, error = self.generate_for_section(
                 section_name, raw_text, summary
             )
-            
+
             if error:
                 logger.warning(f"Failed to generate code for {section_name}: {error}")
                 results[section_name] = (None, error)
             else:
                 results[section_name] = (code, explanation)
-        
+
         logger.info(f"Completed batch generation for {len(results)} sections")
         return results
+
+    async def _generate_all_sections_async(
+        self,
+        sections: List[str],
+        raw_text: str,
+        summary: Summary,
+    ) -> List:
+        """Fan all section generations out concurrently."""
+        coros = [
+            self._generate_for_section_async(section_name, raw_text, summary)
+            for section_name in sections
+        ]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    def _generate_all_in_one_request(
+        self,
+        sections: List[str],
+        raw_text: str,
+        summary: Summary,
+    ) -> Optional[Dict[str, Tuple[Optional[str], Optional[str]]]]:
+        """
+        Generate every section in a single JSON-returning request.
+
+        Returns a results dict matching generate_all_sections, or None
+        when the batch cannot be built, sent, or parsed — the caller then
+        falls back to per-section generation.
+        """
+        blocks = []
+        included = []
+        for section_name in sections:
+            section_text, section_summary = self._extract_section_content(
+                section_name, raw_text, summary
+            )
+            if not section_text:
+                continue
+            body = section_summary or _truncated(section_text, 1500)[:2000]
+            blocks.append(f"## SECTION: {section_name}\n{body}")
+            included.append(section_name)
+
+        if not included:
+            return None
+
+        prompt = _BATCH_PROMPT_TMPL.substitute(
+            paper_title=summary.title,
+            section_blocks="\n\n".join(blocks),
+        )
+        if len(prompt) > _MAX_BATCH_PROMPT_CHARS:
+            logger.info("Batch prompt too large; using per-section generation")
+            return None
+
+        gen_fn = self._gen_fn
+        if not callable(gen_fn):
+            return None
+
+        cache_key = self._cache_key(prompt)
+        raw = llm_cache.get(cache_key) if cache_key is not None else None
+        if raw is None:
+            try:
+                response = gen_fn(prompt)
+                raw = (getattr(response, "text", "") or "").strip()
+            except Exception as e:
+                logger.warning(f"Fused batch generation failed: {e}")
+                return None
+            if raw and cache_key is not None:
+                llm_cache.put(cache_key, raw)
+        else:
+            logger.info("LLM cache hit; skipping API call")
+
+        entries = self._parse_batch_response(raw)
+        if entries is None:
+            return None
+
+        by_name = {
+            str(entry.get("section", "")).strip().lower(): entry
+            for entry in entries
+            if isinstance(entry, dict)
+        }
+
+        results = {}
+        for section_name in included:
+            entry = by_name.get(section_name.strip().lower())
+            code = (entry or {}).get("code")
+            if not code or not isinstance(code, str):
+                # Partial responses would need a second request anyway;
+                # bail out so the fallback regenerates everything.
+                logger.warning(f"Batch response missing section: {section_name}")
+                return None
+
+            explanation = entry.get("explanation")
+            if not explanation or not isinstance(explanation, str):
+                explanation = self._fallback_explanation(section_name)
+
+            is_valid, validation_error, _tree = self._validate_python_syntax(code)
+            if not is_valid:
+                logger.warning(f"Generated code has syntax errors: {validation_error}")
+                explanation = f"⚠️ Note: Generated code may have syntax issues.\n\n{explanation}"
+
+            results[section_name] = (code, explanation)
+
+        return results
+
+    def _parse_batch_response(self, raw: str) -> Optional[List]:
+        """Parse the JSON array out of a fused batch response."""
+        match = _MD_BLOCK_RE.search(raw)
+        payload = (match.group(1) if match else raw).strip()
+        # Tolerate a ```json fence: the block regex only strips python tags
+        if payload.startswith('json'):
+            payload = payload[4:].lstrip()
+        try:
+            entries = json.loads(payload)
+        except ValueError as e:
+            logger.warning(f"Batch response was not valid JSON: {e}")
+            return None
+        if not isinstance(entries, list):
+            logger.warning("Batch response JSON was not an array")
+            return None
+        return entries
+
+    async def _generate_for_section_async(
+        self,
+        section_name: str,
+        raw_text: str,
+        summary: Summary,
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Async counterpart of generate_for_section.
+
+        Same (code, explanation, error) contract, but the two model calls
+        await generate_content_async so sections can overlap in
+        generate_all_sections.
+        """
+        logger.info(f"Generating code for section: {section_name}")
+
+        try:
+            section_text, section_summary = self._extract_section_content(
+                section_name, raw_text, summary
+            )
+
+            if not section_text:
+                error_msg = f"Section '{section_name}' not found in paper. Try another section."
+                logger.warning(error_msg)
+                return None, None, error_msg
+
+            code, explanation = await self._generate_code_implementation_async(
+                section_name=section_name,
+                section_text=section_text,
+                section_summary=section_summary,
+                paper_title=summary.title,
+            )
+
+            if not code:
+                return None, None, "Code generation failed. No output from model."
+
+            if not explanation:
+                explanation = self._fallback_explanation(section_name)
+
+            is_valid, validation_error, _tree = self._validate_python_syntax(code)
+            if not is_valid:
+                logger.warning(f"Generated code has syntax errors: {validation_error}")
+                explanation = f"⚠️ Note: Generated code may have syntax issues.\n\n{explanation}"
+
+            return code, explanation, None
+
+        except Exception as e:
+            error_msg = f"Error generating code: {str(e)}"
+            logger.error(error_msg)
+
+            if "429" in str(e) or "quota" in str(e).lower():
+                error_msg = "⏱️ API Rate Limit Exceeded. Wait 60 seconds and try again."
+
+            return None, None, error_msg
+
+    async def _generate_code_implementation_async(
+        self,
+        section_name: str,
+        section_text: str,
+        section_summary: Optional[str],
+        paper_title: str,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Generate (code, explanation) via the SDK's async API."""
+        prompt = self._build_code_prompt(
+            section_name, section_text, section_summary, paper_title
+        )
+        logger.info(f"Prompt length: {len(prompt)} characters")
+
+        cache_key = self._cache_key(prompt)
+        cached = llm_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("LLM cache hit; skipping API call")
+            return self._split_code_and_explanation(cached)
+
+        gen_fn = self._gen_async_fn
+        if not callable(gen_fn):
+            return None, None
+
+        try:
+            response = await gen_fn(prompt)
+            code_response = (getattr(response, "text", "") or "").strip()
+            if code_response and cache_key is not None:
+                llm_cache.put(cache_key, code_response)
+            return self._split_code_and_explanation(code_response)
+        except Exception as e:
+            logger.error(f"Code generation API call failed: {e}")
+            if "429" in str(e) or "quota" in str(e).lower():
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            raise
     
     def _extract_section_content(
         self,
@@ -226,25 +673,24 @@ class CodeGenerator:
         """
         # Normalize section name
         section_key = section_name.lower().replace('/', ' ').strip()
-        
-        # Common aliases
-        aliases = {
-            'methodology': 'methods',
-            'conclusions': 'conclusion',
-            'techniques': 'methods',
-            'approach': 'methods',
-        }
-        section_key = aliases.get(section_key, section_key)
-        
+        section_key = _SECTION_ALIASES.get(section_key, section_key)
+
         # Detect sections
         sections = detect_sections(raw_text)
-        
-        # Find matching section
-        section_text = None
-        for s in sections.keys():
-            if section_key in s or s in section_key:
-                section_text = extract_section(raw_text, s)
-                break
+
+        # Exact hash lookup on normalized keys first; the O(N) substring
+        # scan only runs as a fallback for partial matches.
+        norm_map = {s.lower().strip(): s for s in sections}
+        matched = norm_map.get(section_key)
+        if matched is None:
+            matched = next(
+                (
+                    original for key, original in norm_map.items()
+                    if section_key in key or key in section_key
+                ),
+                None,
+            )
+        section_text = extract_section(raw_text, matched) if matched else None
         
         # Get section summary from Summary object
         section_summary = None
@@ -262,6 +708,25 @@ class CodeGenerator:
         
         return section_text, section_summary
     
+    def _build_code_prompt(
+        self,
+        section_name: str,
+        section_text: str,
+        section_summary: Optional[str],
+        paper_title: str,
+    ) -> str:
+        """Build the code-generation prompt shared by the sync/async paths."""
+        # Truncate texts to fit context window (reduced for faster generation)
+        section_text_truncated = _truncated(section_text, 1500)
+
+        # Build focused, concise prompt
+        return _CODE_PROMPT_TMPL.substitute(
+            paper_title=paper_title,
+            section_name=section_name,
+            methodology=section_summary or section_text_truncated,
+            detailed_content=section_text_truncated[:2000],
+        )
+
     def _generate_code_implementation(
         self,
         section_name: str,
@@ -270,54 +735,35 @@ class CodeGenerator:
         paper_title: str,
         paper_overview: str,
         full_text: str
-    ) -> Optional[str]:
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        Generate Python code using comprehensive prompt.
-        
+        Generate code and its explanation with a single fused prompt.
+
         Returns:
-            Generated Python code string or None on failure
+            (code, explanation) tuple; either element is None on failure
         """
-        # Truncate texts to fit context window (reduced for faster generation)
-        section_text_truncated = truncate_to_words(section_text, 1500)
-        
-        # Build focused, concise prompt
-        prompt = f"""Generate a complete, runnable Python implementation of the methodology described below.
-
-# PAPER: {paper_title}
-
-# SECTION TO IMPLEMENT: {section_name}
-
-# METHODOLOGY:
-{section_summary or section_text_truncated}
+        prompt = self._build_code_prompt(
+            section_name, section_text, section_summary, paper_title
+        )
 
-# DETAILED CONTENT:
-{section_text_truncated[:2000]}
-
-# REQUIREMENTS:
-Generate complete, working Python code with:
-- Proper imports (numpy, scipy, pandas as needed)
-- Type hints on functions  
-- Brief docstrings
-- A working example in if __name__ == "__main__": block
-- NO placeholders or TODO comments
+        logger.info(f"Prompt length: {len(prompt)} characters")
 
-Output ONLY Python code. Start with imports, end with working example.
-No markdown blocks, no explanations outside code comments.
+        # Reruns over the same paper rebuild byte-identical prompts; serve
+        # those from the on-disk cache instead of re-querying Gemini.
+        cache_key = self._cache_key(prompt)
+        cached = llm_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("LLM cache hit; skipping API call")
+            return self._split_code_and_explanation(cached)
 
-Begin implementation:
-"""
-        
-        logger.info(f"Prompt length: {len(prompt)} characters")
-        
         try:
             # Call Gemini API
             if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
+                if callable(self._gen_fn):
+                    response = self._gen_fn(prompt)
                     code_response = (getattr(response, "text", "") or "").strip()
                 else:
-                    return None
+                    return None, None
             else:
                 gen_content_fn = getattr(genai, "generate_content", None)
                 if callable(gen_content_fn):
@@ -330,7 +776,7 @@ Begin implementation:
             logger.info(f"Received API response: {len(code_response)} characters")
             
             # Check if response was likely truncated (ends abruptly)
-            if code_response and not any(code_response.endswith(marker) for marker in ['"', ')', '}', '\n', '```']):
+            if code_response and not code_response.endswith(('"', ')', '}', '\n', '```')):
                 logger.warning(f"Response may be truncated - ends with: ...{code_response[-50:]}")
             
             # Check for finish reason if available
@@ -341,11 +787,12 @@ Begin implementation:
                     if candidate.finish_reason not in [1, 'STOP']:  # 1 = STOP
                         logger.warning(f"Response finished with reason: {candidate.finish_reason}")
             
-            # Extract code from response (handle markdown blocks)
-            code = self._extract_code_from_response(code_response)
-            
-            return code
-            
+            if code_response and cache_key is not None:
+                llm_cache.put(cache_key, code_response)
+
+            # Split into code and explanation (handles markdown blocks)
+            return self._split_code_and_explanation(code_response)
+
         except Exception as e:
             logger.error(f"Code generation API call failed: {e}")
             if "429" in str(e) or "quota" in str(e).lower():
@@ -357,83 +804,65 @@ Begin implementation:
         Extract Python code from model response, handling markdown formatting.
         """
         # Remove markdown code blocks if present
-        if "```python" in response:
-            start = response.find("```python") + 9
-            end = response.find("```", start)
-            if end != -1:
-                return response[start:end].strip()
-        elif "```" in response:
-            start = response.find("```") + 3
-            end = response.find("```", start)
-            if end != -1:
-                return response[start:end].strip()
-        
+        match = _MD_BLOCK_RE.search(response)
+        if match:
+            return match.group(1).strip()
+
         # Return as-is if no markdown blocks
         return response.strip()
     
-    def _validate_python_syntax(self, code: str) -> Tuple[bool, Optional[str]]:
+    def _validate_python_syntax(
+        self,
+        code: str
+    ) -> Tuple[bool, Optional[str], Optional[ast.AST]]:
         """
         Validate that generated code is syntactically correct Python.
-        
+
+        The parsed tree is returned on success so later analysis passes
+        can reuse it instead of parsing the same blob again.
+
         Returns:
-            (is_valid, error_message)
+            (is_valid, error_message, tree)
         """
+        # A real implementation is never this short; skip parser setup for
+        # empty or truncated responses.
+        if len(code.strip()) < 20:
+            return False, "Response too short to be an implementation", None
+
         try:
-            ast.parse(code)
+            tree = ast.parse(code)
             logger.info("✓ Generated code is syntactically valid")
-            return True, None
+            return True, None, tree
         except SyntaxError as e:
             error_msg = f"Line {e.lineno}: {e.msg}"
             logger.warning(f"Syntax validation failed: {error_msg}")
-            return False, error_msg
+            return False, error_msg, None
         except Exception as e:
             error_msg = str(e)
             logger.warning(f"Validation error: {error_msg}")
-            return False, error_msg
+            return False, error_msg, None
     
-    def _generate_code_explanation(
+    def _split_code_and_explanation(
         self,
-        code: str,
-        section_name: str
-    ) -> str:
-        """
-        Generate a high-level explanation of what the code does.
-        
-        Returns:
-            Human-readable explanation string
+        response: str
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        # Truncate code for prompt
-        code_preview = code[:1500] if len(code) > 1500 else code
-        
-        prompt = f"""Provide a brief, high-level explanation (3-4 sentences) of what this Python code does and how it implements the methodology from the "{section_name}" section of the paper.
+        Split a fused model response into (code, explanation).
 
-Code:
-{code_preview}
+        Falls back to treating the whole response as code when the model
+        ignored the requested block format; the caller substitutes a
+        generic explanation in that case.
+        """
+        match = _CODE_EXPL_RE.search(response)
+        if match:
+            code = self._extract_code_from_response(match.group(1).strip())
+            explanation = match.group(2).strip()
+            return (code or None), (explanation or None)
 
-Write the explanation for a researcher who wants to understand the implementation at a glance. Focus on:
-1. What algorithm/method it implements
-2. Key steps in the implementation
-3. What inputs it expects and outputs it produces
+        code = self._extract_code_from_response(response)
+        return (code or None), None
 
-Explanation:"""
-        
-        try:
-            if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
-                    explanation = (getattr(response, "text", "") or "").strip()
-                    return explanation
-            else:
-                gen_content_fn = getattr(genai, "generate_content", None)
-                if callable(gen_content_fn):
-                    response = gen_content_fn(model=self.model_name, prompt=prompt)
-                    explanation = (getattr(response, "text", "") or "").strip()
-                    return explanation
-            
-            # Fallback
-            return f"Python implementation of the {section_name} methodology described in the paper."
-            
-        except Exception as e:
-            logger.warning(f"Failed to generate explanation: {e}")
-            return f"Python implementation of the {section_name} methodology described in the paper."
+    @staticmethod
+    def _fallback_explanation(section_name: str) -> str:
+        """Generic explanation used when the model omits its own."""
+        return f"Python implementation of the {section_name} methodology described in the paper."
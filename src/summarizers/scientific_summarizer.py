@@ -5,21 +5,61 @@ Implements various approaches to generate high-quality summaries
 using Google's Generative AI models.
 """
 
-from typing import Dict, List, Optional
+import asyncio
+import json
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import google.generativeai as genai
 
 from ..utils.text_processor import (
     detect_sections,
-    extract_section,
     count_words,
     clean_text,
     truncate_to_words,
 )
 from ..utils.logger import logger
+from ..utils import llm_cache
 from config.settings import settings
 
 
+# Strips an optional markdown fence off a JSON batch reply.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Above this prompt size a batched request risks the context window;
+# sections then go back to one call each.
+_MAX_BATCH_PROMPT_CHARS = 120_000
+
+@lru_cache(maxsize=16)
+def _shared_model(model_name: str, temperature: float, max_tokens: int, key_digest: str):
+    """
+    One GenerativeModel per configuration, shared across instances.
+
+    Batch and server runs build a fresh summarizer per paper; reusing the
+    model object amortizes the SDK client setup (and its warm HTTPS
+    channel) to once per process instead of once per instantiation.
+    key_digest folds the configured credential into the cache key: the
+    model object binds its client to the API key active at first use, so
+    a rotated key must map to a fresh model instead of one still
+    authenticated with the old credential.
+    """
+    model_cls = getattr(genai, "GenerativeModel", None)
+    if not callable(model_cls):
+        return None
+    try:
+        return model_cls(
+            model_name=model_name,
+            generation_config={
+                "temperature": temperature,
+                "max_output_tokens": max_tokens,
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Model instantiation failed; will use direct generate calls. Error: {e}")
+        return None
+
+
 @dataclass
 class Summary:
     """Structured summary of a scientific paper."""
@@ -64,26 +104,109 @@ class ScientificPaperSummarizer:
             except Exception:
                 logger.warning("GenAI configure failed; relying on environment auth.")
 
-        # Instantiate model dynamically if available; else fallback to name-only usage.
-        model_cls = getattr(genai, "GenerativeModel", None)
-        if callable(model_cls):
-            try:
-                self._model = model_cls(
-                    model_name=self.model_name,
-                    generation_config={
-                        "temperature": self.temperature,
-                        "max_output_tokens": self.max_tokens,
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Model instantiation failed; will use direct generate calls. Error: {e}")
-                self._model = None
-        else:
-            self._model = None
+        # Instantiate model if available (shared per configuration across
+        # instances); else fallback to name-only usage.
+        self._model = _shared_model(
+            self.model_name, self.temperature, self.max_tokens,
+            llm_cache.prompt_key(settings.google_api_key or ''),
+        )
         self._model_name = self.model_name
-        
+
+        # Resolve the SDK generation entry point once; every call after
+        # this is a plain function call instead of a getattr cascade.
+        self._generate_fn = self._resolve_generate_fn()
+
         logger.info(f"Initialized summarizer with model: {self.model_name}")
-    
+
+    def _resolve_generate_fn(self):
+        """
+        Bind the first usable SDK generation method to a plain callable.
+
+        The probe order matches the old per-call cascade (instantiated
+        model, then the module-level helpers); running it once here means
+        the hot path never repeats the attribute lookups.
+
+        Returns:
+            Callable mapping a prompt to stripped response text, or None
+            when the SDK exposes no generation method at all.
+        """
+        if self._model is not None:
+            gen_fn = getattr(self._model, "generate_content", None)
+            if callable(gen_fn):
+                return lambda prompt: (getattr(gen_fn(prompt), "text", "") or "").strip()
+        gen_content_fn = getattr(genai, "generate_content", None)
+        if callable(gen_content_fn):
+            return lambda prompt: (
+                getattr(gen_content_fn(model=self._model_name, prompt=prompt), "text", "") or ""
+            ).strip()
+        gen_fn_alt = getattr(genai, "generate", None)
+        if callable(gen_fn_alt):
+            return lambda prompt: (
+                getattr(gen_fn_alt(model=self._model_name, prompt=prompt), "text", "") or ""
+            ).strip()
+        return None
+
+    @staticmethod
+    def _is_rate_limit(e: Exception) -> bool:
+        """Whether an SDK error looks like a quota/rate-limit rejection."""
+        msg = str(e)
+        return "429" in msg or "quota" in msg.lower()
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Disk-cache key covering model and sampling settings, not just the prompt."""
+        if not settings.use_cache:
+            return None
+        return llm_cache.prompt_key(f"{self.model_name}|{self.temperature}|{prompt}")
+
+    def _generate_text(self, prompt: str) -> str:
+        """
+        Run one generation through the SDK cascade, with disk caching.
+
+        Identical prompts — common when re-running the same paper during
+        development or after a rate-limit failure — are served from the
+        on-disk cache instead of re-querying Gemini.
+
+        Args:
+            prompt: Prompt to send
+
+        Returns:
+            Stripped response text ('' when the model returned nothing)
+
+        Raises:
+            RuntimeError: If the SDK exposes no usable generation method
+        """
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit; skipping API call")
+                return cached
+
+        if self._generate_fn is None:
+            raise RuntimeError("Gemini SDK provides no usable generation method.")
+        text = self._generate_fn(prompt)
+
+        if text and cache_key is not None:
+            llm_cache.put(cache_key, text)
+        return text
+
+    async def _generate_text_async(self, prompt: str) -> str:
+        """Async counterpart of _generate_text, sharing the same cache."""
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit; skipping API call")
+                return cached
+
+        gen_fn = getattr(self._model, "generate_content_async", None) if self._model else None
+        response = await gen_fn(prompt)
+        text = (getattr(response, "text", "") or "").strip()
+
+        if text and cache_key is not None:
+            llm_cache.put(cache_key, text)
+        return text
+
     def summarize(
         self,
         text: str,
@@ -111,7 +234,7 @@ class ScientificPaperSummarizer:
 
         # Clean the text
         text = clean_text(text)
-        logger.info(f"Processing {count_words(text)} words")
+        logger.info(f"Processing {count_words(text, exact=False)} words")
 
         # Detect sections
         sections = detect_sections(text)
@@ -120,11 +243,17 @@ class ScientificPaperSummarizer:
         # Extract and summarize key sections
         section_summaries = self._summarize_sections(text, sections, effective_max)
 
-        # Generate overview
-        overview = self._generate_overview(text, section_summaries, effective_max)
-
-        # Extract key findings
-        key_findings = self._extract_key_findings(text, section_summaries)
+        # Overview and key findings both depend only on the section
+        # summaries, not on each other, so their round-trips overlap when
+        # the SDK exposes the async API.
+        async_fn = getattr(self._model, "generate_content_async", None) if self._model else None
+        if callable(async_fn):
+            overview, key_findings = asyncio.run(
+                self._overview_and_findings_async(text, section_summaries, effective_max)
+            )
+        else:
+            overview = self._generate_overview(text, section_summaries, effective_max)
+            key_findings = self._extract_key_findings(text, section_summaries)
 
         # Compile full summary and expand if too short
         full_summary = self._compile_full_summary(
@@ -148,7 +277,137 @@ class ScientificPaperSummarizer:
 
         logger.info(f"Summary generated: {summary.word_count} words (cap={effective_max})")
         return summary
-    
+
+    async def summarize_many(
+        self,
+        papers: List[Tuple[str, str]],
+        concurrency: int = 8,
+        summary_max_words: Optional[int] = None,
+    ) -> List[Summary]:
+        """
+        Summarize a corpus of papers concurrently.
+
+        Independent papers' LLM round-trips interleave instead of queuing
+        behind each other; each paper runs the full summarize() pipeline
+        in a worker thread, so intra-paper concurrency (overview/findings
+        overlap) composes with the inter-paper fan-out.
+
+        Args:
+            papers: List of (text, title) pairs
+            concurrency: Maximum papers in flight at once
+            summary_max_words: Per-paper word cap (settings default if None)
+
+        Returns:
+            Summaries in the same order as the input papers
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(text: str, title: str) -> Summary:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.summarize, text, title, summary_max_words
+                )
+
+        logger.info(f"Summarizing {len(papers)} papers (concurrency={concurrency})")
+        return await asyncio.gather(*(_one(text, title) for text, title in papers))
+
+    def summarize_many_sync(
+        self,
+        papers: List[Tuple[str, str]],
+        concurrency: int = 8,
+        summary_max_words: Optional[int] = None,
+    ) -> List[Summary]:
+        """Blocking wrapper around summarize_many for synchronous callers."""
+        return asyncio.run(
+            self.summarize_many(papers, concurrency, summary_max_words)
+        )
+
+    def summarize_with_section(
+        self,
+        text: str,
+        title: str,
+        section_name: str,
+        summary_max_words: Optional[int] = None,
+    ) -> Tuple[Summary, Optional[str]]:
+        """
+        Generate the full summary and one named section summary together.
+
+        Callers that want both otherwise pay two independent pipelines
+        over the same text; a single JSON-returning request shares the
+        prompt prefix and halves the round-trips. The reply is parsed
+        leniently — if it doesn't yield a usable overview, the regular
+        multi-step pipeline runs as a fallback (with no section result).
+
+        Args:
+            text: Full text of the paper
+            title: Paper title
+            section_name: Section to summarize alongside the overview
+            summary_max_words: Overview word cap (settings default if None)
+
+        Returns:
+            (Summary, section_summary); section_summary is None when the
+            model reported no such section or the fused call fell back
+        """
+        effective_max = summary_max_words or settings.summary_max_words
+        section_cap = int(effective_max * 0.6) if effective_max else 300
+        logger.info(f"Fused summarization of: {title} (+ section '{section_name}')")
+
+        cleaned = clean_text(text)
+        source = truncate_to_words(cleaned, 6000)
+
+        prompt = f"""You are an expert at summarizing scientific papers.
+
+Analyze the paper below and reply with ONLY a JSON object with these keys:
+- "overview": a cohesive summary of the whole paper in at most {effective_max} words
+- "key_findings": an array of 3 to 5 strings, one finding per string
+- "section_summary": a summary of the paper's "{section_name}" section in at most {section_cap} words, or an empty string if the paper has no such section
+
+Paper title: {title}
+
+Paper text:
+{source}
+
+JSON:"""
+
+        try:
+            raw = self._generate_text(prompt)
+            match = _JSON_FENCE_RE.search(raw)
+            payload = (match.group(1) if match else raw).strip()
+            data = json.loads(payload)
+            overview = str(data.get("overview", "")).strip()
+            if not overview:
+                raise ValueError("fused reply had no overview")
+        except Exception as e:
+            if self._is_rate_limit(e):
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            logger.warning(f"Fused summary unusable ({e}); using the multi-step pipeline")
+            return self.summarize(text, title, summary_max_words=summary_max_words), None
+
+        raw_findings = data.get("key_findings", [])
+        key_findings = [
+            item.strip() for item in raw_findings
+            if isinstance(item, str) and item.strip()
+        ][:5] if isinstance(raw_findings, list) else []
+        section_summary = str(data.get("section_summary", "")).strip() or None
+
+        parts = ["# SCIENTIFIC PAPER SUMMARY\n", "## Overview", overview]
+        if key_findings:
+            parts.append("\n## Key Findings")
+            parts.extend(f"{i}. {finding}" for i, finding in enumerate(key_findings, 1))
+        full_summary = "\n\n".join(parts)
+        if effective_max:
+            full_summary = truncate_to_words(full_summary, effective_max)
+
+        summary = Summary(
+            title=title,
+            overview=overview,
+            key_findings=key_findings,
+            full_summary=full_summary,
+            word_count=count_words(full_summary),
+        )
+        logger.info(f"Fused summary generated: {summary.word_count} words")
+        return summary, section_summary
+
     def _summarize_sections(self, text: str, sections: Dict[str, tuple], effective_max: int) -> Dict[str, str]:
         """
         Summarize individual sections of the paper.
@@ -175,89 +434,223 @@ class ScientificPaperSummarizer:
         section_budget_pool = max(100, int(total_budget * 0.6))
         per_section_words = max(80, int(section_budget_pool / max(1, len(present) or 1)))
 
-        for section_name in priority_sections:
-            if section_name in sections:
-                section_text = extract_section(text, section_name)
-                if section_text and len(section_text) > 100:
-                    logger.info(f"Summarizing section: {section_name}")
-                    summary = self._summarize_chunk(
-                        section_text,
-                        section_name,
-                        target_words=per_section_words,
-                    )
-                    section_summaries[section_name] = summary
+        # One fused call for all sections when there is more than one;
+        # falls back to per-section calls if the reply doesn't parse.
+        if len(present) > 1:
+            batched = self._summarize_sections_batched(
+                text, present, per_section_words, sections
+            )
+            if batched is not None:
+                return batched
+
+        # The spans are already in hand; slice directly rather than
+        # going back through extract_section.
+        work = []
+        for section_name in present:
+            start, end = sections[section_name]
+            section_text = text[start:end].strip()
+            if section_text and len(section_text) > 100:
+                work.append((section_name, section_text))
+
+        # When the batched call fell through and the SDK exposes the
+        # async API, the per-section calls fan out concurrently; their
+        # network waits overlap so the fallback costs roughly one
+        # round-trip instead of N.
+        async_fn = getattr(self._model, "generate_content_async", None) if self._model else None
+        if callable(async_fn) and len(work) > 1:
+            logger.info(f"Summarizing {len(work)} sections concurrently")
+            outcomes = asyncio.run(self._summarize_chunks_async(work, per_section_words))
+            for (section_name, _), outcome in zip(work, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.warning(f"Failed to summarize {section_name}: {outcome}")
+                    continue
+                section_summaries[section_name] = outcome
+            return section_summaries
+
+        for section_name, section_text in work:
+            logger.info(f"Summarizing section: {section_name}")
+            section_summaries[section_name] = self._summarize_chunk(
+                section_text,
+                section_name,
+                target_words=per_section_words,
+            )
 
         return section_summaries
-    
-    def _summarize_chunk(self, text: str, context: str = "", target_words: int = 150) -> str:
+
+    async def _summarize_chunks_async(
+        self,
+        work: List[Tuple[str, str]],
+        per_section_words: int,
+    ) -> List:
+        """Fan per-section summary calls out concurrently."""
+        coros = [
+            self._summarize_chunk_async(section_text, section_name, per_section_words)
+            for section_name, section_text in work
+        ]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    def _summarize_sections_batched(
+        self,
+        text: str,
+        present: List[str],
+        per_section_words: int,
+        sections: Dict[str, tuple],
+    ) -> Optional[Dict[str, str]]:
         """
-        Summarize a chunk of text using the AI model.
-        
-        Args:
-            text: Text to summarize
-            context: Context about what this text represents
-            
+        Summarize every priority section with a single model call.
+
+        Packs the section bodies into one delimited prompt and asks for a
+        JSON object keyed by section name, turning N round-trips into one.
+
         Returns:
-            Generated summary
+            Section summaries dict, or None when the batch is too large or
+            the reply doesn't parse (the caller then falls back to the
+            per-section loop).
         """
+        blocks = []
+        names = []
+        for section_name in present:
+            start, end = sections[section_name]
+            section_text = text[start:end].strip()
+            if section_text and len(section_text) > 100:
+                blocks.append(
+                    f"<<<SECTION name={section_name}>>>\n{section_text}\n<<<END>>>"
+                )
+                names.append(section_name)
+
+        if not names:
+            # Nothing worth summarizing; same outcome as the serial loop
+            return {}
+
+        joined_blocks = "\n\n".join(blocks)
         prompt = f"""You are an expert at summarizing scientific papers.
 
+Below are sections of one scientific paper, each delimited by <<<SECTION name=...>>> and <<<END>>> markers.
+
+{joined_blocks}
+
+For every section, provide a clear, concise summary of about {per_section_words} words that captures the essential information.
+Focus on the key points, methods, findings, or conclusions as appropriate for each section.
+Use technical language where necessary but ensure clarity.
+
+Reply with ONLY a JSON object mapping each section name to its summary, for example:
+{{"methods": "...", "results": "..."}}
+
+JSON:"""
+
+        if len(prompt) > _MAX_BATCH_PROMPT_CHARS:
+            logger.info("Batched section prompt too large; summarizing per section")
+            return None
+
+        logger.info(f"Summarizing {len(names)} sections in one call")
+        try:
+            findings_text = self._generate_text(prompt)
+        except Exception as e:
+            logger.error(f"Batched section summarization failed: {e}")
+            if self._is_rate_limit(e):
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            raise RuntimeError(f"Section summarization failed: {e}") from e
+
+        if not findings_text:
+            return None
+
+        match = _JSON_FENCE_RE.search(findings_text)
+        payload = (match.group(1) if match else findings_text).strip()
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning("Batched section reply was not valid JSON; falling back")
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        section_summaries = {}
+        for name in names:
+            value = data.get(name)
+            if not isinstance(value, str) or not value.strip():
+                logger.warning(f"Batched reply missing section '{name}'; falling back")
+                return None
+            section_summaries[name] = value.strip()
+
+        return section_summaries
+    
+    @staticmethod
+    def _build_chunk_prompt(text: str, context: str, target_words: int) -> str:
+        """Build the chunk prompt shared by the sync/async paths."""
+        return f"""You are an expert at summarizing scientific papers.
+
 Context: This is the {context} section of a scientific paper.
 
 Text to summarize:
 {text}
 
-Please provide a clear, concise summary that captures the essential information. 
+Please provide a clear, concise summary that captures the essential information.
 Focus on the key points, methods, findings, or conclusions as appropriate for this section.
 Use technical language where necessary but ensure clarity. Limit to about {target_words} words.
 
 Summary:"""
 
+    def _summarize_chunk(self, text: str, context: str = "", target_words: int = 150) -> str:
+        """
+        Summarize a chunk of text using the AI model.
+
+        Args:
+            text: Text to summarize
+            context: Context about what this text represents
+
+        Returns:
+            Generated summary
+        """
+        prompt = self._build_chunk_prompt(text, context, target_words)
+
         try:
-            # Prefer instantiated model if available
-            if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
-                    return (getattr(response, "text", "") or "").strip() or "Summary generation failed."
-            # Fallback: module-level generation helpers (dynamic)
-            gen_content_fn = getattr(genai, "generate_content", None)
-            if callable(gen_content_fn):
-                response = gen_content_fn(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or "Summary generation failed."
-            gen_fn_alt = getattr(genai, "generate", None)
-            if callable(gen_fn_alt):
-                response = gen_fn_alt(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or "Summary generation failed."
-            raise RuntimeError("Gemini SDK provides no usable generation method.")
+            return self._generate_text(prompt) or "Summary generation failed."
         except Exception as e:
             logger.error(f"Error summarizing chunk: {e}")
             # Check if it's a rate limit error
-            if "429" in str(e) or "quota" in str(e).lower():
+            if self._is_rate_limit(e):
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            raise RuntimeError(f"Section summarization failed: {e}") from e
+
+    async def _summarize_chunk_async(self, text: str, context: str = "", target_words: int = 150) -> str:
+        """Async counterpart of _summarize_chunk, sharing the same cache."""
+        prompt = self._build_chunk_prompt(text, context, target_words)
+
+        try:
+            return await self._generate_text_async(prompt) or "Summary generation failed."
+        except Exception as e:
+            logger.error(f"Error summarizing chunk: {e}")
+            if self._is_rate_limit(e):
                 raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
             raise RuntimeError(f"Section summarization failed: {e}") from e
     
-    def _generate_overview(self, text: str, section_summaries: Dict[str, str], effective_max: int) -> str:
-        """
-        Generate a high-level overview of the paper.
-        
-        Args:
-            text: Full paper text
-            section_summaries: Summaries of individual sections
-            
-        Returns:
-            Overview text
-        """
-        logger.info("Generating overview")
-        
+    async def _overview_and_findings_async(
+        self,
+        text: str,
+        section_summaries: Dict[str, str],
+        effective_max: int,
+    ) -> tuple:
+        """Run the overview and key-findings calls concurrently."""
+        return await asyncio.gather(
+            self._generate_overview_async(text, section_summaries, effective_max),
+            self._extract_key_findings_async(text, section_summaries),
+        )
+
+    def _build_overview_prompt(
+        self,
+        text: str,
+        section_summaries: Dict[str, str],
+        effective_max: int,
+    ) -> str:
+        """Build the overview prompt shared by the sync/async paths."""
         # If no section summaries, use the raw text (first ~2000 chars)
         if not section_summaries:
             logger.warning("No section summaries available, using raw text for overview")
             context = text[:2000] + "..." if len(text) > 2000 else text
-            
+
             # If sections are missing, dedicate more budget to overview (comprehensive fallback)
             overview_target = max(400, int(effective_max * 0.8))
-            prompt = f"""You are an expert at summarizing scientific papers.
+            return f"""You are an expert at summarizing scientific papers.
 
 Read this excerpt from a scientific paper and provide a comprehensive overview (~{overview_target} words) that captures the paper's main contribution, approach, and significance.
 
@@ -271,15 +664,15 @@ Generate a cohesive overview that:
 4. Indicates significance or implications
 
 Overview:"""
-        else:
-            # Combine section summaries for context
-            context = "\n\n".join([
-                f"{section.upper()}:\n{summary}" 
-                for section, summary in section_summaries.items()
-            ])
-            
-            overview_target = max(200, int(effective_max * 0.4))
-            prompt = f"""You are an expert at summarizing scientific papers.
+
+        # Combine section summaries for context
+        context = "\n\n".join([
+            f"{section.upper()}:\n{summary}"
+            for section, summary in section_summaries.items()
+        ])
+
+        overview_target = max(200, int(effective_max * 0.4))
+        return f"""You are an expert at summarizing scientific papers.
 
 Based on these section summaries from a scientific paper, provide a comprehensive overview (~{overview_target} words) that captures the paper's main contribution, approach, and significance.
 
@@ -294,101 +687,141 @@ Generate a cohesive overview that:
 
 Overview:"""
 
+    async def _generate_overview_async(
+        self,
+        text: str,
+        section_summaries: Dict[str, str],
+        effective_max: int,
+    ) -> str:
+        """Async counterpart of _generate_overview."""
+        logger.info("Generating overview")
+        prompt = self._build_overview_prompt(text, section_summaries, effective_max)
+
         try:
-            if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
-                    return (getattr(response, "text", "") or "").strip() or "Overview generation failed."
-            gen_content_fn = getattr(genai, "generate_content", None)
-            if callable(gen_content_fn):
-                response = gen_content_fn(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or "Overview generation failed."
-            gen_fn_alt = getattr(genai, "generate", None)
-            if callable(gen_fn_alt):
-                response = gen_fn_alt(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or "Overview generation failed."
-            raise RuntimeError("Gemini SDK provides no usable generation method.")
+            return await self._generate_text_async(prompt) or "Overview generation failed."
         except Exception as e:
             logger.error(f"Error generating overview: {e}")
-            # Check if it's a rate limit error
-            if "429" in str(e) or "quota" in str(e).lower():
+            if self._is_rate_limit(e):
                 raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
             raise RuntimeError(f"Overview generation failed: {e}") from e
-    
-    def _extract_key_findings(self, text: str, section_summaries: Dict[str, str]) -> List[str]:
+
+    def _generate_overview(self, text: str, section_summaries: Dict[str, str], effective_max: int) -> str:
         """
-        Extract key findings as bullet points.
-        
+        Generate a high-level overview of the paper.
+
         Args:
             text: Full paper text
-            section_summaries: Summaries of sections
-            
+            section_summaries: Summaries of individual sections
+
         Returns:
-            List of key findings
+            Overview text
         """
-        logger.info("Extracting key findings")
-        
+        logger.info("Generating overview")
+        prompt = self._build_overview_prompt(text, section_summaries, effective_max)
+
+        try:
+            return self._generate_text(prompt) or "Overview generation failed."
+        except Exception as e:
+            logger.error(f"Error generating overview: {e}")
+            # Check if it's a rate limit error
+            if self._is_rate_limit(e):
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            raise RuntimeError(f"Overview generation failed: {e}") from e
+    
+    def _build_findings_prompt(self, text: str, section_summaries: Dict[str, str]) -> str:
+        """Build the key-findings prompt shared by the sync/async paths."""
         # Focus on results and conclusion sections
-        relevant_text = ""
-        for section in ['results', 'discussion', 'conclusion']:
-            if section in section_summaries:
-                relevant_text += f"\n\n{section_summaries[section]}"
-        
-        if not relevant_text and section_summaries:
-            relevant_text = "\n\n".join(section_summaries.values())
-        
+        parts = [
+            section_summaries[section]
+            for section in ('results', 'discussion', 'conclusion')
+            if section in section_summaries
+        ]
+        if not parts:
+            parts = list(section_summaries.values())
+        relevant_text = "\n\n".join(parts)
+
         # If still no section summaries, use raw text
         if not relevant_text:
             logger.warning("No section summaries available for key findings, using raw text")
             relevant_text = text[:3000] + "..." if len(text) > 3000 else text
-        
-        prompt = f"""You are an expert at analyzing scientific papers.
+
+        return f"""You are an expert at analyzing scientific papers.
 
 Based on this text from a scientific paper, extract 3-5 key findings or contributions.
 
 Text:
 {relevant_text}
 
-Provide the key findings as a numbered list. Each finding should be:
+Reply with ONLY a JSON array of 3 to 5 strings, one finding per string, for example:
+["First finding.", "Second finding."]
 
-Key Findings:"""
+JSON:"""
 
+    @staticmethod
+    def _parse_findings(findings_text: str) -> List[str]:
+        """Parse the findings reply: JSON array first, numbered list as fallback."""
+        match = _JSON_FENCE_RE.search(findings_text)
+        payload = (match.group(1) if match else findings_text).strip()
         try:
-            if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
-                    findings_text = (getattr(response, "text", "") or "").strip()
-                else:
-                    findings_text = ""
-            else:
-                gen_content_fn = getattr(genai, "generate_content", None)
-                if callable(gen_content_fn):
-                    response = gen_content_fn(model=self._model_name, prompt=prompt)
-                    findings_text = (getattr(response, "text", "") or "").strip()
-                else:
-                    gen_fn_alt = getattr(genai, "generate", None)
-                    if callable(gen_fn_alt):
-                        response = gen_fn_alt(model=self._model_name, prompt=prompt)
-                        findings_text = (getattr(response, "text", "") or "").strip()
-                    else:
-                        raise RuntimeError("Gemini SDK provides no usable generation method.")
-            
-            # Parse into list
-            findings = []
-            for line in findings_text.split('\n'):
-                line = line.strip()
-                # Remove numbering like "1.", "1)", etc.
-                line = line.lstrip('0123456789.)-• ')
-                if line:
-                    findings.append(line)
-            
-            return findings[:5]  # Limit to 5 findings
+            data = json.loads(payload)
+        except ValueError:
+            data = None
+        if isinstance(data, list):
+            findings = [
+                item.strip() for item in data
+                if isinstance(item, str) and item.strip()
+            ]
+            if findings:
+                return findings[:5]
+
+        # The model replied with prose/a numbered list anyway; strip the
+        # numbering ("1.", "1)", bullets) line by line.
+        findings = []
+        for line in findings_text.split('\n'):
+            line = line.strip().lstrip('0123456789.)-• ')
+            if line:
+                findings.append(line)
+        return findings[:5]
+
+    async def _extract_key_findings_async(
+        self,
+        text: str,
+        section_summaries: Dict[str, str],
+    ) -> List[str]:
+        """Async counterpart of _extract_key_findings."""
+        logger.info("Extracting key findings")
+        prompt = self._build_findings_prompt(text, section_summaries)
+
+        try:
+            findings_text = await self._generate_text_async(prompt)
+            return self._parse_findings(findings_text)
+        except Exception as e:
+            logger.error(f"Error extracting key findings: {e}")
+            if self._is_rate_limit(e):
+                raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
+            raise RuntimeError(f"Key findings extraction failed: {e}") from e
+
+    def _extract_key_findings(self, text: str, section_summaries: Dict[str, str]) -> List[str]:
+        """
+        Extract key findings as bullet points.
+
+        Args:
+            text: Full paper text
+            section_summaries: Summaries of sections
+
+        Returns:
+            List of key findings
+        """
+        logger.info("Extracting key findings")
+        prompt = self._build_findings_prompt(text, section_summaries)
+
+        try:
+            findings_text = self._generate_text(prompt)
+            return self._parse_findings(findings_text)
         except Exception as e:
             logger.error(f"Error extracting key findings: {e}")
             # Check if it's a rate limit error
-            if "429" in str(e) or "quota" in str(e).lower():
+            if self._is_rate_limit(e):
                 raise RuntimeError(f"API Rate Limit Exceeded: {e}") from e
             raise RuntimeError(f"Key findings extraction failed: {e}") from e
     
@@ -436,9 +869,11 @@ Key Findings:"""
         
         full = "\n\n".join(parts)
 
-        # If we're significantly below target, try an expansion pass
+        # Expansion costs a full extra model round-trip, so only pay for it
+        # when the shortfall is big enough to matter; marginal gaps (say
+        # 80% of target) rarely gain enough quality to justify the call.
         target = max(200, effective_max)
-        if count_words(full) < int(target * 0.85):
+        if count_words(full) < max(150, int(target * 0.70)):
             expanded = self._expand_summary(source_text, full, target_words=target)
             if expanded:
                 full = expanded
@@ -452,35 +887,29 @@ Key Findings:"""
         """Expand a concise summary into a comprehensive one using the source text.
 
         Tries to reach approximately target_words while preserving structure and avoiding repetition.
+        The source goes in as a truncated inline excerpt: expansion is the
+        only call in the pipeline that re-sends source text (overview and
+        key findings work from the section summaries), so a server-side
+        context cache would be created, referenced once and deleted —
+        uploading and tokenizing far more than the excerpt it replaces.
         """
-        prompt = f"""You are an expert technical writer.
-
-Expand the following scientific paper summary to approximately {target_words} words.
-Use the SOURCE TEXT to add missing details (problem statement, assumptions, methodology highlights, key results, limitations, and implications).
+        instructions = f"""Expand the following scientific paper summary to approximately {target_words} words.
+Use the source text to add missing details (problem statement, assumptions, methodology highlights, key results, limitations, and implications).
 Preserve the markdown structure and keep it factual and non-repetitive.
 
-SOURCE TEXT (use for details):
-{truncate_to_words(source_text, 2500)}
-
 CURRENT SUMMARY (to expand):
 {current_summary}
 
 Write the expanded summary now, maintaining the same headings:
 """
+        prompt = f"""You are an expert technical writer.
+
+SOURCE TEXT (use for details):
+{truncate_to_words(source_text, 2500)}
+
+{instructions}"""
         try:
-            if self._model is not None:
-                gen_fn = getattr(self._model, "generate_content", None)
-                if callable(gen_fn):
-                    response = gen_fn(prompt)
-                    return (getattr(response, "text", "") or "").strip() or current_summary
-            gen_content_fn = getattr(genai, "generate_content", None)
-            if callable(gen_content_fn):
-                response = gen_content_fn(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or current_summary
-            gen_fn_alt = getattr(genai, "generate", None)
-            if callable(gen_fn_alt):
-                response = gen_fn_alt(model=self._model_name, prompt=prompt)
-                return (getattr(response, "text", "") or "").strip() or current_summary
+            return self._generate_text(prompt) or current_summary
         except Exception as e:
             logger.error(f"Expansion failed: {e}")
         return current_summary
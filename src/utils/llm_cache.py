@@ -0,0 +1,62 @@
+"""
+Tiny on-disk cache for LLM responses keyed by prompt hash.
+
+Repeated runs over the same paper rebuild identical prompts; caching the
+raw model responses turns those network round-trips into file reads.
+Entries are content-addressed (BLAKE2b of the prompt), so any change to
+a prompt naturally becomes a cache miss.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+from .logger import logger
+
+# One file per entry under the user cache dir; overridable for tests/CI.
+_CACHE_DIR = Path(
+    os.getenv('LLM_CACHE_DIR', str(Path.home() / '.cache' / 'paper_summarizer' / 'llm'))
+)
+
+
+def prompt_key(prompt: str) -> str:
+    """Return the content-addressed cache key for a prompt."""
+    return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """
+    Return the cached value for a key, or None on a miss.
+
+    Args:
+        key: Cache key from prompt_key
+
+    Returns:
+        Cached string value or None
+    """
+    try:
+        return (_CACHE_DIR / key).read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def put(key: str, value: str) -> None:
+    """
+    Store a value under a key.
+
+    Writes go through a temp file and an atomic rename so concurrent
+    processes never observe partial entries. Failures are logged rather
+    than raised; the cache is an optimization, not a dependency.
+
+    Args:
+        key: Cache key from prompt_key
+        value: String value to store
+    """
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(value, encoding='utf-8')
+        tmp_path.replace(_CACHE_DIR / key)
+    except OSError as e:
+        logger.warning(f"LLM cache write failed: {e}")
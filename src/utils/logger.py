@@ -1,52 +1,77 @@
 """
 Logger configuration for the summarizing agent.
 
-Provides structured logging with rich formatting for console output.
+Interactive sessions get rich console formatting; server and batch runs
+get a plain StreamHandler, since Rich's per-line styling and layout work
+is pure overhead when nobody is watching the terminal.
 """
 
 import logging
+import os
+import sys
 from pathlib import Path
-from rich.logging import RichHandler
-from rich.console import Console
+
+
+def _use_rich() -> bool:
+    """Rich output for terminals, overridable via SUMMARIZER_RICH=0/1."""
+    raw = os.getenv('SUMMARIZER_RICH')
+    if raw is not None:
+        return raw.strip().lower() in ('1', 'true', 'yes', 'on')
+    try:
+        return sys.stdout.isatty()
+    except Exception:
+        return False
 
 
 def setup_logger(name: str = "summarizer", level: int = logging.INFO) -> logging.Logger:
     """
     Set up a logger with rich console output.
-    
+
     Args:
         name: Logger name
         level: Logging level
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     # Avoid adding handlers multiple times
     if logger.handlers:
         return logger
-    
-    # Rich handler for beautiful console output
-    console = Console()
-    handler = RichHandler(
-        console=console,
-        rich_tracebacks=True,
-        markup=True,
-        show_time=True,
-        show_path=False
-    )
-    
+
+    handler = None
+    if _use_rich():
+        try:
+            from rich.console import Console
+            from rich.logging import RichHandler
+
+            # Rich handler for beautiful console output; RichHandler
+            # renders its own timestamp column, so the formatter only
+            # carries the message.
+            handler = RichHandler(
+                console=Console(),
+                rich_tracebacks=True,
+                markup=True,
+                show_time=True,
+                show_path=False
+            )
+            handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+        except ImportError:
+            handler = None
+
+    if handler is None:
+        # Plain handler for non-interactive runs: no ANSI styling or
+        # column layout per record, just a timestamped line.
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+        )
+
     handler.setLevel(level)
-    formatter = logging.Formatter(
-        "%(message)s",
-        datefmt="[%X]"
-    )
-    handler.setFormatter(formatter)
-    
     logger.addHandler(handler)
-    
+
     return logger
 
 